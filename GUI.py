@@ -7,25 +7,296 @@ initialized in the main program.
 
 The .ui files were created and designed mainly using the PyQt5 Designer
 Application, and can be viewed/edited in said application as well for
-ease of use.
+ease of use. They are compiled ahead of time into Python modules, so after
+editing a .ui file, re-generate its module with:
+    pyuic5 gui_v2.ui -o ui_mainwindow.py
+    pyuic5 gui_popup_window.ui -o ui_popup.py
 
 @author: Anya Dovgal
 """
-import os
-import time
-import sys
-import clr
+import re
 import json
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
 
-from System import Decimal  # necessary for real world units
-
-from PyQt5 import QtWidgets, uic, QtGui, QtCore
+from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtCore import QTimer
 
-from KPZ101 import KPZ101
+from ui_mainwindow import Ui_MainWindow # Compiled from gui_v2.ui
+from ui_popup import Ui_Form # Compiled from gui_popup_window.ui
+
+from KPZ101 import KPZ101, POLLING_RATE, MAX_JOG_STEP, buildDeviceList
 from Exceptions import MisMatchSerialError, DeviceCountError
 
-class Ui(QtWidgets.QMainWindow):
+# orjson is used for the serial number file if it is installed, otherwise
+#   the standard json module is used (both work with bytes)
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Default refresh rates, which can be overridden with the 'pollMs',
+#   'idlePollMs' and 'activePollMs' keys of SERIALS_FILE. None of them are
+#   faster than the devices' own POLLING_RATE, as reading the voltage more
+#   often than the device updates it would only return the same value again.
+POLL_INTERVAL = 1000 # ms, refresh rate while the voltages are changing
+IDLE_POLL_INTERVAL = 2000 # ms, refresh rate once the voltages settle
+ACTIVE_POLL_INTERVAL = POLLING_RATE # ms, refresh rate right after a jog/set
+ACTIVE_PERIOD = 3000 # ms, how long the active refresh rate is kept up
+IDLE_TICKS = 5 # Unchanged refreshes before backing off to the idle rate
+CONNECT_WAIT_STEP = 0.05 # s, how often the window is repainted while the
+                         #   devices are being connected
+JOG_REPEAT_INTERVAL = 50 # ms, jog rate while a d-pad button is held down
+SET_VOLTAGE_DELAY = 100 # ms, how long setVoltage() waits for another Enter
+                        #   press before sending the voltage to the device
+
+SERIALS_FILE = Path('saved_serial_numbers.json')
+_SERIAL_RE = re.compile(r'\A\d{8}\Z') # KPZ101 serial numbers are 8 digits
+_SERIALS_CACHE = None # Contents of SERIALS_FILE, once it has been read
+
+def _loadSerialFile():
+    """
+    Returns the dictionary of saved serial numbers. The json file is only
+    read the first time this is called, after which the cached dictionary
+    is returned.
+    """
+    global _SERIALS_CACHE
+    if _SERIALS_CACHE is None:
+        # Read the whole (small) file in one go
+        _SERIALS_CACHE = _loads(SERIALS_FILE.read_bytes())
+    return _SERIALS_CACHE
+
+def _saveSerialFile(serials):
+    """
+    Writes the (cached) dictionary of serial numbers back to the json file,
+    serialized up-front so that the file is written in one go.
+    
+    The data is written to a temporary file first, which then replaces the
+    json file, so a crash part-way through cannot leave it corrupted.
+    """
+    temp_file = SERIALS_FILE.with_name(SERIALS_FILE.name + '.tmp')
+    temp_file.write_bytes(_dumps(serials))
+    temp_file.replace(SERIALS_FILE)
+
+def _readInterval(serials, key, default):
+    """
+    Returns the refresh rate saved under key in the (cached) dictionary of
+    SERIALS_FILE as a whole number of ms, no faster than POLLING_RATE. If it
+    is missing or is not a number, default is used instead.
+    """
+    value = serials.get(key, default)
+    try:
+        interval = int(value) # QTimer only takes whole ms
+    except (TypeError, ValueError, OverflowError):
+        print('Invalid refresh rate for', key + ':', repr(value))
+        interval = default
+    return max(interval, POLLING_RATE)
+
+class Axis:
+    """
+    Groups one KPZ101 device with the GUI widgets that display its data, so
+    that the same helper methods in Ui() can be used for either direction.
+    
+    Attributes
+    ----------
+    kpz : KPZ101 Object
+        The KPZ101 device for this direction of motion
+    lcd : QWidgets.QLCDNumber
+        The lcd display for the current voltage of kpz
+    buttonForward : QWidgets.QPushButton
+        The d-pad button that increases the voltage while
+        direction_state == True (left/up)
+    buttonReverse : QWidgets.QPushButton
+        The d-pad button that decreases the voltage while
+        direction_state == True (right/down)
+    direction_state : Boolean
+        The d-pad direction of the axis, see Ui.switchDirection()
+    last_v : float
+        The voltage that is currently shown on lcd, or None if nothing has
+        been displayed yet
+    max_v : float
+        The maximum output voltage of kpz, which does not change while
+        the device is connected (None if it has not been read yet)
+    jog : float
+        The voltage jog step of kpz, which only changes through setJogStep()
+        in the GUI
+    pool : QtCore.QThreadPool
+        The single-thread pool that runs every KpzTask for kpz, so that the
+        commands for the device run one at a time, in the order they were
+        started, without holding up the other axis
+    polling : Boolean
+        True while the timer's voltage read for kpz has not come back yet
+    jogging : Boolean
+        True while a jog of kpz from the d-pad has not finished yet
+    connected : Boolean
+        Whether kpz is connected, kept up to date by the GUI when it connects
+        or disconnects the device, so that every refresh does not have to
+        ask the device
+    pending_v : float
+        The voltage entered into setVoltage() that has not been sent to kpz
+        yet, or None
+    """
+    __slots__ = ('kpz', 'lcd', 'buttonForward', 'buttonReverse',
+                 'direction_state', 'last_v', 'max_v', 'jog', 'pool',
+                 'polling', 'jogging', 'connected', 'pending_v')
+    
+    def __init__(self, kpz, lcd, buttonForward, buttonReverse, pool):
+        self.kpz = kpz
+        self.lcd = lcd
+        self.buttonForward = buttonForward
+        self.buttonReverse = buttonReverse
+        self.direction_state = True
+        self.last_v = None
+        self.max_v = None
+        self.jog = kpz.getJogStepsFloat(2)
+        self.pool = pool
+        self.polling = False
+        self.jogging = False
+        self.connected = kpz.isConnected()
+        self.pending_v = None
+        self.cacheMaxVoltage()
+        
+    def cacheMaxVoltage(self):
+        """
+        Reads the maximum output voltage from the device once, so that it
+        does not have to be queried on every refresh.
+        """
+        if self.connected:
+            self.max_v = self.kpz.getMaxVoltageFloat(2)
+        else:
+            self.max_v = None
+
+class KpzTaskSignals(QtCore.QObject):
+    """
+    The signals of a KpzTask (a QRunnable cannot define signals itself).
+    
+    finished(float) is emitted with the voltage of the device, read right
+    after the task's command has run, and then done() is emitted (done() is
+    emitted on its own for a task that does not read the voltage). If the
+    command raised an error, failed(str, bool) is emitted instead, with its
+    message and whether the device is still connected.
+    """
+    finished = QtCore.pyqtSignal(float)
+    done = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str, bool)
+    
+class KpzTask(QtCore.QRunnable):
+    """
+    Runs one (blocking) KPZ101 command on the worker thread of its axis'
+    pool, so that the GUI does not freeze while the device settles, and
+    reports the resulting voltage back to the GUI thread through
+    signals.finished.
+    
+    Attributes
+    ----------
+    axis : Axis
+        The axis whose device the command is for
+    fn : callable
+        The KPZ101 method to be called, or None to only read the voltage
+    args : tuple
+        The arguments for fn
+    read : Boolean
+        Whether to read the voltage after fn has run (False for commands
+        that leave the device disconnected)
+    batch : PollBatch
+        If given, the voltage (or None, if the read failed) and whether the
+        device is connected are added to batch instead of being emitted
+        through signals
+    signals : KpzTaskSignals
+    """
+    
+    def __init__(self, axis, fn, *args, read=True, batch=None):
+        super().__init__()
+        self.axis = axis
+        self.fn = fn
+        self.args = args
+        self.read = read
+        self.batch = batch
+        self.signals = KpzTaskSignals()
+        
+    def run(self):
+        kpz = self.axis.kpz
+        try:
+            if self.fn is not None:
+                self.fn(*self.args)
+            if self.read:
+                kpz.update()
+                current_voltage = kpz.getVoltageFloat(2)
+        except Exception as e:
+            print(e)
+            # Whether the error was the device being disconnected is checked
+            #   here, on the device's own thread, rather than on the GUI thread
+            try:
+                connected = kpz.refreshState()
+            except Exception:
+                connected = False
+            if self.batch is not None:
+                self.batch.add(self.axis, None, connected)
+            else:
+                self.signals.failed.emit(str(e), connected)
+            return
+        if self.batch is not None:
+            self.batch.add(self.axis, current_voltage, True)
+            return
+        if self.read:
+            self.signals.finished.emit(current_voltage)
+        self.signals.done.emit()
+
+class PollBatch(QtCore.QObject):
+    """
+    Collects the voltages read by the timer's KpzTasks on the worker threads,
+    so that the readings of both devices cross over to the GUI thread in a
+    single queued ready() call, instead of one queued signal per reading.
+    
+    ready() is only emitted for the first reading added after the last
+    take(), and the GUI thread then takes every reading that has come in
+    since, in one go.
+    """
+    ready = QtCore.pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mutex = QtCore.QMutex()
+        self._pending = deque()
+        self._scheduled = False
+        
+    def add(self, axis, voltage, connected):
+        """
+        Adds a reading of the axis' device (None for a failed read), and
+        whether the device is connected, from a worker thread.
+        """
+        self._mutex.lock()
+        try:
+            self._pending.append((axis, (voltage, connected)))
+            notify = not self._scheduled
+            self._scheduled = True
+        finally:
+            self._mutex.unlock()
+        if notify:
+            self.ready.emit()
+            
+    def take(self):
+        """
+        Returns the latest reading of each axis that has come in since the
+        last call, as a dictionary of {axis: (voltage, connected)}, from the
+        GUI thread.
+        """
+        self._mutex.lock()
+        try:
+            latest = dict(self._pending) # Later readings replace earlier ones
+            self._pending.clear()
+            self._scheduled = False
+        finally:
+            self._mutex.unlock()
+        return latest
+
+class Ui(QtWidgets.QMainWindow, Ui_MainWindow):
     """
     The main GUI for Piezo control, with all graphics designed in the 
     PyQt Designer application. 
@@ -39,6 +310,21 @@ class Ui(QtWidgets.QMainWindow):
     timer : QTimer
         Mainly for updating the voltage display so that it accurately
         reflects the real-time voltage of the piezo devices
+    active_timer : QTimer
+        Single-shot timer that ends the faster refresh rate used after the
+        user moves a piezo (see enterActiveMode())
+    set_v_timer_x, set_v_timer_y : QTimer
+        Single-shot timers that send the voltage entered into setVoltage()
+        to each device, once Enter has not been pressed again for
+        SET_VOLTAGE_DELAY ms
+    poll_interval, idle_poll_interval, active_poll_interval : int
+        The refresh rates of the timer in ms (see loadSerials())
+    pool_x, pool_y : QThreadPool
+        Run the blocking KPZ101 commands (see KpzTask) of each device off of
+        the GUI thread, on one worker thread per device
+    poll_batch : PollBatch
+        Passes the timer's voltage readings from the pools back to the GUI
+        thread
     popupWindow : QWidget
         The pop-up window to help users change the connected piezo device
         in the software
@@ -63,35 +349,38 @@ class Ui(QtWidgets.QMainWindow):
         If serial_x & serial_y = None, then initialize the KPZs from the
         saved serial number. This method is also called to test that the serial
         numbers are valid and the KPZs WILL initialize
-    update(device)
-        Updates the GUI panel for data from device
-    setZero(device)
-        Sets the voltage of device to zero
-    increaseVoltage(device)
-        Jogs the voltage of device up
-    decreaseVoltage(device)
-        Jogs the voltage of device down
-    setVoltage(device)
+    update(axis)
+        Updates the GUI panel for data from the axis' device
+    enterActiveMode()
+        Speeds up the refresh rate for a while after the user moves a piezo
+    setZero(axis)
+        Sets the voltage of the axis' device to zero
+    setVoltage(axis)
         Sets the voltage of the device to the inputted value
-    setJogStep(device)
+    setJogStep(axis)
         Sets the voltage jogging step of the device to the inputted value
-    disconnectPiezo(device)
+    disconnectPiezo(axis)
         Disconnects the device from the computer
-    connectPiezo(device)
+    connectPiezo(axis)
         Connects the device to the computer
-    disablePiezo(device)
+    disablePiezo(axis)
         Disables the device voltage output
-    enablePiezo(device)
+    enablePiezo(axis)
         Enables the device voltage output
-    switchDirectionX/Y()
+    moveForward/Reverse(axis)
+        The d-pad slots, which jog the voltage up or down depending on the
+        direction of the axis
+    switchDirection(axis)
         Switches the d-pad direction to jogging step direction, to improve
         usability
-    checkJogLimitX/Y()
-        Helper function for switchDirectionX/Y()
+    checkJogLimit(axis, current_voltage)
+        Helper function for switchDirection()
     openPopup()
         Open the pop-up window
     saveFromPopup()
         Try to initialize the KPZs, and if working
+    changeEvent()
+        Pauses the voltage refresh while the window is minimized
     closeEvent()
         Adds a check that all of the devices are disconnected & disabled
         before software is closed.
@@ -102,81 +391,117 @@ class Ui(QtWidgets.QMainWindow):
         json file, and starts up the corresponding KPZ 101 devices.
         """
         super(Ui, self).__init__()
-        uic.loadUi('gui_v2.ui', self)
+        self.setupUi(self)
         self.popupWindow = None # Place-holder for the pop-up window
         self.errorWindow = None
         self.KPZ101_x = None
         self.KPZ101_y = None
-        
-        #self.setStyleSheet("background-color: #f6cefc;")
+        self._idle_ticks = 0
+        self._last_enables = {} # Last enabled-state set on each d-pad button
+        self._connecting = False # True while initializeKPZs() is running
+        self._stopping = set() # Axes that saveFromPopup() is stopping
         
         self.loadSerials()
-        self.initializeKPZs()
         self.timer = QTimer()
-        self.setupConnections()
+        # A 1-2 s refresh does not need ms accuracy, and a coarse timer does
+        #   not raise the system timer resolution (and power draw) on Windows
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.active_timer = QTimer()
+        self.active_timer.setSingleShot(True)
+        self.active_timer.setInterval(ACTIVE_PERIOD)
+        self.active_timer.timeout.connect(self._leaveActiveMode)
+        self.set_v_timer_x = QTimer()
+        self.set_v_timer_y = QTimer()
+        for set_v_timer in (self.set_v_timer_x, self.set_v_timer_y):
+            set_v_timer.setSingleShot(True)
+            set_v_timer.setInterval(SET_VOLTAGE_DELAY)
+        # Each device is only ever used from its own pool's single worker
+        #   thread, never from the GUI thread, so its commands never overlap
+        #   and a slow command for one device does not hold up the other
+        self.pool_x = QtCore.QThreadPool(self)
+        self.pool_y = QtCore.QThreadPool(self)
+        for pool in (self.pool_x, self.pool_y):
+            pool.setMaxThreadCount(1)
+        self.poll_batch = PollBatch(self)
+        self.poll_batch.ready.connect(self._onPollBatch)
         
+        # Show the window straight away, while the devices are connecting
         self.show()
+        self.initializeKPZs()
+        self.setupConnections()
         
     def setupConnections(self):
         """
         Connects the GUI widgets to the class helper methods, for each device
         that is currently connected to the computer/ software.
         """
+        # Hold back repaints until all of the widgets have been set up, so
+        #   the buttons hidden/lcds filled below are drawn in one go
+        self.setUpdatesEnabled(False)
+        
         ## GUI Buttons for X (Horizontal) Piezo Controller
-        self.kpzx = [self.KPZ101_x, self.lcdNumberCVX]
-        
-        self.buttonMoveLeft.clicked.connect(lambda : self.increaseVoltage(self.kpzx))
-        self.buttonMoveRight.clicked.connect(lambda : self.decreaseVoltage(self.kpzx))
-        self.lineEditSetVX.returnPressed.connect(lambda : self.setVoltage(self.kpzx, self.lineEditSetVX))
-        self.lineEditSetJX.returnPressed.connect(lambda : self.setJogStep(self.kpzx, self.lineEditSetJX, self.lcdNumberCJX))
-        self.buttonSetZeroX.clicked.connect(lambda : self.setZero(self.kpzx))
-        self.buttonDisconnectX.clicked.connect(lambda : self.disconnectPiezo(self.kpzx, self.buttonDisconnectX, self.buttonConnectX))
-        self.buttonConnectX.clicked.connect(lambda : self.connectPiezo(self.kpzx, self.buttonDisconnectX, self.buttonConnectX))
+        self.axisX = Axis(self.KPZ101_x, self.lcdNumberCVX,
+                          self.buttonMoveLeft, self.buttonMoveRight,
+                          self.pool_x)
+        
+        self.buttonMoveLeft.clicked.connect(partial(self.moveForward, self.axisX))
+        self.buttonMoveRight.clicked.connect(partial(self.moveReverse, self.axisX))
+        self.lineEditSetVX.returnPressed.connect(partial(self.setVoltage, self.axisX, self.lineEditSetVX, self.set_v_timer_x))
+        self.set_v_timer_x.timeout.connect(partial(self._sendPendingVoltage, self.axisX, self.lineEditSetVX))
+        self.lineEditSetJX.returnPressed.connect(partial(self.setJogStep, self.axisX, self.lineEditSetJX, self.lcdNumberCJX))
+        self.buttonSetZeroX.clicked.connect(partial(self.setZero, self.axisX))
+        self.buttonDisconnectX.clicked.connect(partial(self.disconnectPiezo, self.axisX, self.buttonDisconnectX, self.buttonConnectX))
+        self.buttonConnectX.clicked.connect(partial(self.connectPiezo, self.axisX, self.buttonDisconnectX, self.buttonConnectX))
         self.buttonConnectX.hide()
-        self.buttonDisableX.clicked.connect(lambda : self.disablePiezo(self.kpzx, self.buttonEnableX, self.buttonDisableX))
-        self.buttonEnableX.clicked.connect(lambda : self.enablePiezo(self.kpzx, self.buttonEnableX, self.buttonDisableX))
+        self.buttonDisableX.clicked.connect(partial(self.disablePiezo, self.axisX, self.buttonEnableX, self.buttonDisableX))
+        self.buttonEnableX.clicked.connect(partial(self.enablePiezo, self.axisX, self.buttonEnableX, self.buttonDisableX))
         self.buttonEnableX.hide()
-        self.buttonSwitchX.clicked.connect(lambda : self.switchDirectionX(self.kpzx))
-
-        self.direction_stateX = True
+        self.buttonSwitchX.clicked.connect(partial(self.switchDirection, self.axisX))
         
         #Set-up jog-steps upon initialization
-        jogstepx = float(self.KPZ101_x.getJogSteps().ToString())
-        self.lcdNumberCJX.display(jogstepx)
+        self.lcdNumberCJX.display(self.axisX.jog)
 
         #===========================================================
 
         ## GUI Buttons for Y (Vertical) Piezo Controller
-        self.kpzy = [self.KPZ101_y, self.lcdNumberCVY]
-        
-        self.buttonMoveUp.clicked.connect(lambda : self.increaseVoltage(self.kpzy))
-        self.buttonMoveDown.clicked.connect(lambda : self.decreaseVoltage(self.kpzy))
-        self.lineEditSetVY.returnPressed.connect(lambda : self.setVoltage(self.kpzy, self.lineEditSetVY))
-        self.lineEditSetJY.returnPressed.connect(lambda : self.setJogStep(self.kpzy, self.lineEditSetJY, self.lcdNumberCJY))
-        self.buttonSetZeroY.clicked.connect(lambda : self.setZero(self.kpzy))
-        self.buttonDisconnectY.clicked.connect(lambda : self.disconnectPiezo(self.kpzy, self.buttonDisconnectY, self.buttonConnectY))
-        self.buttonConnectY.clicked.connect(lambda : self.connectPiezo(self.kpzy, self.buttonDisconnectY, self.buttonConnectY))
+        self.axisY = Axis(self.KPZ101_y, self.lcdNumberCVY,
+                          self.buttonMoveUp, self.buttonMoveDown,
+                          self.pool_y)
+        
+        self.buttonMoveUp.clicked.connect(partial(self.moveForward, self.axisY))
+        self.buttonMoveDown.clicked.connect(partial(self.moveReverse, self.axisY))
+        self.lineEditSetVY.returnPressed.connect(partial(self.setVoltage, self.axisY, self.lineEditSetVY, self.set_v_timer_y))
+        self.set_v_timer_y.timeout.connect(partial(self._sendPendingVoltage, self.axisY, self.lineEditSetVY))
+        self.lineEditSetJY.returnPressed.connect(partial(self.setJogStep, self.axisY, self.lineEditSetJY, self.lcdNumberCJY))
+        self.buttonSetZeroY.clicked.connect(partial(self.setZero, self.axisY))
+        self.buttonDisconnectY.clicked.connect(partial(self.disconnectPiezo, self.axisY, self.buttonDisconnectY, self.buttonConnectY))
+        self.buttonConnectY.clicked.connect(partial(self.connectPiezo, self.axisY, self.buttonDisconnectY, self.buttonConnectY))
         self.buttonConnectY.hide()
-        self.buttonDisableY.clicked.connect(lambda : self.disablePiezo(self.kpzy, self.buttonEnableY, self.buttonDisableY))
-        self.buttonEnableY.clicked.connect(lambda : self.enablePiezo(self.kpzy, self.buttonEnableY, self.buttonDisableY))
+        self.buttonDisableY.clicked.connect(partial(self.disablePiezo, self.axisY, self.buttonEnableY, self.buttonDisableY))
+        self.buttonEnableY.clicked.connect(partial(self.enablePiezo, self.axisY, self.buttonEnableY, self.buttonDisableY))
         self.buttonEnableY.hide()
-        self.buttonSwitchY.clicked.connect(lambda : self.switchDirectionY(self.kpzy))
-        
-        self.direction_stateY = True
+        self.buttonSwitchY.clicked.connect(partial(self.switchDirection, self.axisY))
         
         #Set-up jog-steps upon initialization
-        jogstepy = float(self.KPZ101_y.getJogSteps().ToString())
-        self.lcdNumberCJY.display(jogstepy)
+        self.lcdNumberCJY.display(self.axisY.jog)
 
         #====================================================================
 
+        # The d-pad buttons auto-repeat (see gui_v2.ui), so holding one down
+        #   keeps jogging the voltage
+        for button in (self.buttonMoveLeft, self.buttonMoveRight,
+                       self.buttonMoveUp, self.buttonMoveDown):
+            button.setAutoRepeatInterval(JOG_REPEAT_INTERVAL)
+
         self.actionChangeSerial.triggered.connect(self.openPopup)
+        
+        self.setUpdatesEnabled(True) # Also schedules a repaint
 
-        self.timer.start(1000)
-        self.timer.timeout.connect(lambda : self.update(self.kpzx))
-        self.timer.timeout.connect(self.checkJogLimitX)
-        self.timer.timeout.connect(lambda : self.update(self.kpzy))
-        self.timer.timeout.connect(self.checkJogLimitY)
+        self.timer.timeout.connect(self._onTick)
+        # Not started if there is nothing to refresh (yet); _restartRefresh()
+        #   or _resumeRefresh() start it once there is
+        if self._canRefresh():
+            self.timer.start(self.poll_interval)
         
     def resetConnections(self):
         """
@@ -186,40 +511,66 @@ class Ui(QtWidgets.QMainWindow):
         disconnecting and then re-connecting them
         """
         self.timer.disconnect()
+        self.actionChangeSerial.triggered.disconnect()
+        # A voltage that has not been sent yet is for the old devices
+        self.set_v_timer_x.stop()
+        self.set_v_timer_x.disconnect()
+        self.set_v_timer_y.stop()
+        self.set_v_timer_y.disconnect()
         
         self.buttonMoveLeft.disconnect()
         self.buttonMoveRight.disconnect()
         self.lineEditSetVX.disconnect()
         self.lineEditSetJX.disconnect()
+        self.buttonSetZeroX.disconnect()
+        self.buttonDisconnectX.disconnect()
+        self.buttonConnectX.disconnect()
+        self.buttonDisableX.disconnect()
+        self.buttonEnableX.disconnect()
         self.buttonSwitchX.disconnect()
         
         self.buttonMoveUp.disconnect()
         self.buttonMoveDown.disconnect()
         self.lineEditSetVY.disconnect()
         self.lineEditSetJY.disconnect()
+        self.buttonSetZeroY.disconnect()
+        self.buttonDisconnectY.disconnect()
+        self.buttonConnectY.disconnect()
+        self.buttonDisableY.disconnect()
+        self.buttonEnableY.disconnect()
         self.buttonSwitchY.disconnect()
     
     def loadSerials(self):
         """
-        Loads the serial numbers that are saved to the software
+        Loads the serial numbers that are saved to the software, as well as
+        the (optional) refresh rates of the voltage display, in ms
         """
-        with open('saved_serial_numbers.json', 'r') as openfile:
-            json_object = json.load(openfile)
+        json_object = _loadSerialFile()
         
         self.serial_x = json_object['serialX']
         self.serial_y = json_object['serialY']
         
-        openfile.close()
+        self.poll_interval = _readInterval(
+            json_object, 'pollMs', POLL_INTERVAL)
+        self.idle_poll_interval = _readInterval(
+            json_object, 'idlePollMs', IDLE_POLL_INTERVAL)
+        self.active_poll_interval = _readInterval(
+            json_object, 'activePollMs', ACTIVE_POLL_INTERVAL)
+        
+        if not (_SERIAL_RE.match(self.serial_x)
+                and _SERIAL_RE.match(self.serial_y)):
+            print('The saved serial numbers are not 8-digit numbers:',
+                  self.serial_x, self.serial_y)
         
     def saveSerials(self, serial_x, serial_y):
         """
         Changes the saved serial numbers to the newly inputted/ connected ones
         """        
-        dictionary = {'serialX' : serial_x,
-                      'serialY' : serial_y}
+        dictionary = _loadSerialFile()
+        dictionary['serialX'] = serial_x
+        dictionary['serialY'] = serial_y
 
-        with open("saved_serial_numbers.json", "w") as outfile:
-            json.dump(dictionary, outfile)
+        _saveSerialFile(dictionary)
             
         self.serial_x = serial_x
         self.serial_y = serial_y
@@ -228,7 +579,8 @@ class Ui(QtWidgets.QMainWindow):
         """
         If no serial numbers are specified, attempts to initialize the KPZs for
         the saved numbers. Otherwise, attempts to initialize the KPZs for the
-        inputted numbers.
+        inputted numbers. The two KPZs are initialized at the same time, on
+        two threads.
         
         If either a MisMatchSerialError or a DeviceCountError occur, the user
         will be prompted via pop-up to fix the problem (either close app and
@@ -241,321 +593,547 @@ class Ui(QtWidgets.QMainWindow):
         serial_y : String, optional
             DESCRIPTION. The default is None.
         """
-        if serial_x == None:
+        if serial_x is None:
             serial_x = self.serial_x
-        if serial_y == None:
+        if serial_y is None:
             serial_y = self.serial_y
         
         self.isPopupOpen = False
         
+        # Look for the connected devices once, then connect to both of them
+        #   at the same time, so their settling waits overlap
+        buildDeviceList(rebuild=True)
+        
+        # The controls are disabled (and the window can not be closed) until
+        #   the devices are ready, but the window is kept painted meanwhile
+        self._connecting = True
+        self.centralwidget.setEnabled(False)
+        self.statusbar.showMessage('Connecting to the piezo controllers...')
         try:
-            temp_x = KPZ101(serial_x)
-            temp_y = KPZ101(serial_y)
-            
-            self.KPZ101_x = None
-            self.KPZ101_y = None
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future_x = executor.submit(KPZ101, serial_x)
+                future_y = executor.submit(KPZ101, serial_y)
+                while wait((future_x, future_y), CONNECT_WAIT_STEP).not_done:
+                    QtWidgets.QApplication.processEvents()
+            try:
+                temp_x = future_x.result()
+                temp_y = future_y.result()
+            except BaseException:
+                # The other KPZ may have been connected before this one
+                #   failed (for whatever reason), and would otherwise be left
+                #   connected with its output on
+                for future in (future_x, future_y):
+                    if future.exception() is None:
+                        future.result().stop()
+                raise
             
             self.KPZ101_x = temp_x
             self.KPZ101_y = temp_y
         
-        except ValueError as e:
+        except (MisMatchSerialError, DeviceCountError) as e:
             """
             This section can possibly be expanded for error handling.
             """
             # self.isPopupOpen = True
             print(e.message)
-            if type(e) == MisMatchSerialError: # If the recorded serial # is not right
+            if isinstance(e, MisMatchSerialError): # If the recorded serial # is not right
                 attempt = e.attempt # The serial number that is not connected
                 actual = e.actual # The serial numbers that are connected
                 # print('I have reached here')
                 # self.openSerialErrorPopup()
             
-            elif type(e) == DeviceCountError: # If the connected devices is < 2
+            else: # DeviceCountError, if the connected devices is < 2
                 count = e.count # Num. of devices actually connected
                 # self.openCountErrorPopup()
                 # print('I have reached here')
                 
+        finally:
+            self._connecting = False
+            self.centralwidget.setEnabled(True)
+            self.statusbar.clearMessage()
+                
         # while self.isPopupOpen == True:
         #     pass
         
-    def update(self, device):
+    def _onTick(self):
+        """
+        Every time the timer elapses, starts refreshing the voltage display
+        and the d-pad jog limits for both devices from a single slot, instead
+        of dispatching a separate timer callback for each of them. The
+        readings themselves are handled by _onPollBatch().
+        
+        If neither voltage has changed for IDLE_TICKS refreshes, the timer
+        backs off to idle_poll_interval until a change is seen again.
+        """
+        self._idle_ticks += 1
+        if self._idle_ticks > IDLE_TICKS and not self.active_timer.isActive():
+            self._setPollInterval(self.idle_poll_interval)
+        
+        self._pollBoth()
+        
+    def _onPollBatch(self):
+        """
+        Handles every voltage reading that update() has queued up since the
+        last batch, only using the latest one of each axis.
+        """
+        for axis, reading in self.poll_batch.take().items():
+            current_voltage, connected = reading
+            if current_voltage is None:
+                self._onPollFailed(axis, connected)
+            else:
+                self._onPolled(axis, current_voltage)
+        
+    def _onPolled(self, axis, current_voltage):
+        """
+        Displays a voltage read by update() (and with it, updates the jog
+        limits of its axis). A change in voltage sets the timer back to
+        poll_interval.
+        """
+        axis.polling = False
+        if self._display(axis, current_voltage):
+            self._idle_ticks = 0
+            if not self.active_timer.isActive():
+                self._setPollInterval(self.poll_interval)
+        
+    def _setPollInterval(self, interval):
+        """
+        Changes the refresh rate of the timer, if it is not already set.
+        """
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+            
+    def enterActiveMode(self):
+        """
+        Refreshes the voltage display every active_poll_interval ms for the
+        next ACTIVE_PERIOD ms, so that a jog/set is shown quickly. Calling it
+        again (e.g. while a d-pad button is held) restarts the period.
+        """
+        self._idle_ticks = 0
+        self._setPollInterval(self.active_poll_interval)
+        self.active_timer.start()
+        
+    def _leaveActiveMode(self):
+        """
+        Goes back to the normal refresh rate once the active period is over.
+        """
+        self._setPollInterval(self.poll_interval)
+        
+    def _onPollFailed(self, axis, connected):
+        """
+        Lets the next tick read the axis' device again after a failed read,
+        unless the KpzTask found that the failure was the device being
+        disconnected.
+        """
+        axis.polling = False
+        if not connected:
+            axis.connected = False
+            if not self._anyConnected():
+                self.timer.stop() # Nothing left to refresh
+        
+    def update(self, axis):
         """
         Every 1000 milliseconds, the program 'updates', retrieving the voltage
         data from the kpz and displays it on the gui. It also updtes when
         the voltage is jogged/set.
         
+        The voltage is read by a KpzTask on the axis' pool, so the GUI
+        thread never waits on the USB connection, and the reading is passed
+        back to the GUI thread through poll_batch (see _onPollBatch()). A
+        device that is disconnected, or whose previous read has not come
+        back yet, is skipped.
+        
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         """
-        kpz = device[0]
-        lcdDisplay = device[1]
-        if kpz.isConnected():
-            kpz.update()
-            current_voltage = kpz.getVoltageFloat(2)
-            lcdDisplay.display(current_voltage)   
+        if axis.connected and not axis.polling:
+            axis.polling = True
+            axis.pool.start(KpzTask(axis, None, batch=self.poll_batch))
         
-    def setZero(self, device):
+    def _pollBoth(self):
         """
-        Sets the KPZ voltage to 'zero'
-
-        Parameters
-        ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
-            The KPZ101 and corresponding voltage lcd display
+        Starts a voltage read for each device (see update()), so that the two
+        devices are read at the same time on separate worker threads.
         """
-        kpz = device[0]
-        kpz.setZero()
-        self.update(device)
+        self.update(self.axisX)
+        self.update(self.axisY)
         
-    def increaseVoltage(self, device):
+    def _display(self, axis, current_voltage):
         """
-        When the button is pressed (& held) the voltage is increased by
-        intervals of the jogging rate
-
-        Parameters
-        ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
-            The KPZ101 and corresponding voltage lcd display
+        Shows current_voltage on the axis' lcd display and updates the jog
+        limits for it, unless it is already being shown. Returns True if the
+        display changed.
         """
-        kpz = device[0]
-        kpz.jogVoltage(True)
-        self.update(device)
-
-    def decreaseVoltage(self, device):
+        previous = axis.last_v
+        if previous is not None and abs(current_voltage - previous) < 1e-3:
+            return False
+        axis.last_v = current_voltage
+        axis.lcd.display(current_voltage)
+        self.checkJogLimit(axis, current_voltage)
+        return True
+        
+    def _submit(self, axis, fn, *args, finished=None, done=None, failed=None,
+                read=True):
         """
-        When the button is pressed (& held) the voltage is decreased by
-        intervals of the jogging rate
+        Runs fn(*args) for the axis' device on its pool. When it is done,
+        the new voltage is displayed (unless read is False) and, if given,
+        finished(voltage) and done() are called on the GUI thread
+        (failed(message) if it raised).
+        """
+        task = KpzTask(axis, fn, *args, read=read)
+        task.signals.finished.connect(partial(self._display, axis))
+        if finished is not None:
+            task.signals.finished.connect(finished)
+        if done is not None:
+            task.signals.done.connect(done)
+        if failed is not None:
+            task.signals.failed.connect(failed)
+        axis.pool.start(task)
+        
+    def setZero(self, axis):
+        """
+        Sets the KPZ voltage to 'zero'
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         """
-        kpz = device[0]
-        kpz.jogVoltage(False)
-        self.update(device)
+        kpz = axis.kpz
+        self._submit(axis, kpz.setZero)
+        self.enterActiveMode()
         
-    def setVoltage(self, device, lineEditV):
+    def setVoltage(self, axis, lineEditV, set_v_timer):
         """
         When an input is given, the current voltage of the device is set to
         the input
+        
+        The new voltage is sent to the device by _sendPendingVoltage() once
+        set_v_timer runs out. The voltage is left in lineEditV until then, so
+        pressing Enter again (or entering another voltage) restarts the wait,
+        and only the last voltage is sent. Rather than waiting for it to
+        settle (which would hold up further commands for the axis), the
+        faster refresh of enterActiveMode() shows the voltage as it changes.
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         lineEditV : QWidgets.QLineEdit
             The line editor where the desired voltage is inputted.
+        set_v_timer : QTimer
+            The axis' single-shot timer, see set_v_timer_x/y
+        """
+        text = lineEditV.text()
+        if not text: # Enter pressed on an empty field
+            return
+        try:
+            current_voltage = float(text)
+        except ValueError: # Not a number, so nothing is sent to the device
+            lineEditV.clear()
+            print('Invalid voltage:', repr(text))
+            return
+        # Out of range voltages would be ignored by the device anyway
+        if axis.max_v is not None and not 0 <= current_voltage <= axis.max_v:
+            lineEditV.clear()
+            return
+        axis.pending_v = current_voltage
+        set_v_timer.start() # (Re)starts the wait for another Enter press
+        
+    def _sendPendingVoltage(self, axis, lineEditV):
+        """
+        Sends the last voltage entered into setVoltage() to the device, and
+        clears lineEditV.
         """
-        kpz = device[0]
-        current_voltage = Decimal(float(lineEditV.text()))
-        kpz.setVoltage(current_voltage)
-        self.update(device)
+        voltage = axis.pending_v
+        axis.pending_v = None
+        if voltage is None:
+            return
         lineEditV.clear()
+        self._submit(axis, axis.kpz.sendVoltage, voltage)
+        self.enterActiveMode()
         
-    def setJogStep(self, device, lineEditJ, lcdCJ):
+    def setJogStep(self, axis, lineEditJ, lcdCJ):
         """
         When an input is given, the current jog step is set to the input
         and the lcd display is updated
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         lineEditJ : QWidgets.QLineEdit
             The line editor where the desired jogging step is inputted.
         lcdCJ : QWidgets.QLCDNumber
             The lcd display for the current jogging step.
         """
-        current_jog_step = Decimal(float(lineEditJ.text()))
-        kpz = device[0]
-        kpz.setJogSteps(current_jog_step)
-        lcdCJ.display(kpz.getJogStepsFloat(2))
+        text = lineEditJ.text()
         lineEditJ.clear()
+        if not text: # Enter pressed on an empty field
+            return
+        try:
+            current_jog_step = float(text)
+        except ValueError: # Not a number, so nothing is sent to the device
+            print('Invalid jog step:', repr(text))
+            return
+        # Out of range jog steps (also nan/inf) would be ignored by
+        #   setJogSteps() anyway, so they are not sent to the device at all
+        if not 0 <= current_jog_step <= MAX_JOG_STEP:
+            return
+        kpz = axis.kpz
+        self._submit(axis, kpz.setJogSteps, current_jog_step,
+                     finished=partial(self._displayJogStep, axis, lcdCJ))
         
-    def disconnectPiezo(self, device, buttonDisc, buttonCon):
+    def _displayJogStep(self, axis, lcdCJ, current_voltage):
+        """
+        Once setJogStep() has finished, stores the device's (new) jog step on
+        the axis and shows it on lcdCJ, if it differs from the one shown.
+        """
+        jog = axis.kpz.getJogStepsFloat(2)
+        if jog == axis.jog:
+            return
+        axis.jog = jog
+        lcdCJ.display(jog)
+        self._recheckJogLimit(axis)
+        
+    def disconnectPiezo(self, axis, buttonDisc, buttonCon):
         """
         Upon pushing the button, the KPZ is disconnected from the software
-        and the button is replaced with a connection button
+        and the button is replaced with a connection button, once the
+        device has been disconnected on the thread pool
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         buttonDisc : QWidgets.QPushButton
             The 'disconnect' button, for disconnecting the device.
         buttonCon : QWidgets.QPushButton
             The 'connect' button, for re-connecting the device.
         """
-        kpz = device[0]
-        kpz.disconnect()
-        buttonDisc.hide()
-        buttonCon.show()
+        axis.connected = False # No more voltage reads are started for it
+        axis.max_v = None # Re-read by connectPiezo()
+        if not self._anyConnected():
+            self.timer.stop() # Nothing left to refresh, see _onConnected()
+        buttonDisc.setEnabled(False)
+        self._submit(axis, axis.kpz.disconnect, read=False,
+                     done=partial(self._swapButtons, buttonDisc, buttonCon),
+                     failed=partial(self._onCommandFailed, axis, buttonDisc))
         
-    def connectPiezo(self, device, buttonDisc, buttonCon):
+    def connectPiezo(self, axis, buttonDisc, buttonCon):
         """
         Upon pushing the button, the KPZ is resconnected from the software
-        and the button is replaced with a disconnection button
+        and the button is replaced with a disconnection button, once the
+        device has been connected on the thread pool
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         buttonDisc : QWidgets.QPushButton
             The 'disconnect' button, for disconnecting the device.
         buttonCon : QWidgets.QPushButton
             The 'connect' button, for re-connecting the device.
         """
-        kpz = device[0]
-        kpz.connect()
-        buttonDisc.show()
-        buttonCon.hide()
+        buttonCon.setEnabled(False)
+        self._submit(axis, axis.kpz.connect,
+                     done=partial(self._onConnected, axis, buttonDisc, buttonCon),
+                     failed=partial(self._onCommandFailed, axis, buttonCon))
+        
+    def _onConnected(self, axis, buttonDisc, buttonCon):
+        """
+        Once connectPiezo() has connected the device, starts refreshing it
+        again and swaps the buttons. The timer is restarted if it was stopped
+        because both devices had been disconnected.
+        """
+        axis.connected = True
+        axis.cacheMaxVoltage()
+        self._recheckJogLimit(axis)
+        self._swapButtons(buttonCon, buttonDisc)
+        self._restartRefresh()
+        
+    def _restartRefresh(self):
+        """
+        Restarts the timer after it was stopped because both devices were
+        disconnected, unless it is paused for the pop-up or the minimized
+        window anyway.
+        """
+        if not self.timer.isActive() and self._canRefresh():
+            self._resumeRefresh()
         
-    def enablePiezo(self, device, buttonEn, buttonDis):
+    def enablePiezo(self, axis, buttonEn, buttonDis):
         """
-        Upon pushing the button, the KPZ voltage output is enabled
-        and the button is replaced with a disable button
+        Upon pushing the button, the KPZ voltage output is enabled (on the
+        thread pool) and the button is then replaced with a disable button
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         buttonEn : QWidgets.QPushButton
             The 'enable' button, for enabling the device output.
         buttonDis : QWidgets.QPushButton
             The 'disable' button, for disabling the device output.
         """
-        kpz = device[0]
-        kpz.enable()
-        buttonEn.hide()
-        buttonDis.show()
+        buttonEn.setEnabled(False)
+        self._submit(axis, axis.kpz.enable,
+                     done=partial(self._swapButtons, buttonEn, buttonDis),
+                     failed=partial(self._onCommandFailed, axis, buttonEn))
     
-    def disablePiezo(self, device, buttonEn, buttonDis):
+    def disablePiezo(self, axis, buttonEn, buttonDis):
         """
-        Upon pushing the button, the KPZ voltage output is disabled
-        and the button is replaced with a enable button
+        Upon pushing the button, the KPZ voltage output is disabled (on the
+        thread pool) and the button is then replaced with a enable button
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         buttonEn : QWidgets.QPushButton
             The 'enable' button, for enabling the device output.
         buttonDis : QWidgets.QPushButton
             The 'disable' button, for disbaling the device output.
         """
-        kpz = device[0]
-        kpz.disable()
-        buttonDis.hide()
-        buttonEn.show()
+        buttonDis.setEnabled(False)
+        self._submit(axis, axis.kpz.disable,
+                     done=partial(self._swapButtons, buttonDis, buttonEn),
+                     failed=partial(self._onCommandFailed, axis, buttonDis))
+        
+    def _swapButtons(self, buttonOld, buttonNew):
+        """
+        Replaces buttonOld (whose command has finished) with buttonNew.
+        """
+        buttonOld.hide()
+        buttonOld.setEnabled(True)
+        buttonNew.show()
+        
+    def _onCommandFailed(self, axis, button, message, connected):
+        """
+        If a connect/disconnect/enable/disable command fails, lets the user
+        press its button again, and takes over whether the device is still
+        connected, as checked by the KpzTask.
+        """
+        button.setEnabled(True)
+        axis.connected = connected
+        axis.cacheMaxVoltage()
+        if axis.connected:
+            self._restartRefresh()
+        
+    def moveForward(self, axis):
+        """
+        The slot for the left/up d-pad buttons: jogs the voltage up, or down
+        if the direction of the axis has been switched.
+        """
+        self._jog(axis, axis.direction_state)
+            
+    def moveReverse(self, axis):
+        """
+        The slot for the right/down d-pad buttons: jogs the voltage down, or
+        up if the direction of the axis has been switched.
+        """
+        self._jog(axis, not axis.direction_state)
+        
+    def _jog(self, axis, increase):
+        """
+        Jogs the voltage of the axis up (increase == True) or down. While a
+        d-pad button is held, it repeats every JOG_REPEAT_INTERVAL ms; a
+        repeat is skipped if the previous jog of the axis is still running,
+        so that held buttons cannot queue up jogs behind a slow device.
+        """
+        if axis.jogging:
+            return
+        axis.jogging = True
+        done = partial(self._onJogged, axis)
+        self._submit(axis, axis.kpz.jogVoltage, increase,
+                     finished=done, failed=done)
+        self.enterActiveMode()
+        
+    def _onJogged(self, axis, *result):
+        """
+        Lets the d-pad jog the axis again once the previous jog is done (or
+        has failed), whatever its result.
+        """
+        axis.jogging = False
         
-    def switchDirectionX(self, device):
+    def switchDirection(self, axis):
         """
         This method is mainly for user-friendliness.
         Essentially, it lets the user map the d-pad direction to the real
         motion, or camera direction. This lets the program be used more easily.
+        
+        The d-pad buttons stay connected to moveForward()/moveReverse(),
+        which check the direction of the axis each time they are pressed.
 
         Parameters
         ----------
-        device : [KPZ101, QWidgets.QLCDNumber]
+        axis : Axis
             The KPZ101 and corresponding voltage lcd display
         """
-        if self.direction_stateX == True:
-            self.buttonMoveLeft.clicked.disconnect()
-            self.buttonMoveRight.clicked.disconnect()
-            self.buttonMoveLeft.clicked.connect(lambda : self.decreaseVoltage(self.kpzx))
-            self.buttonMoveRight.clicked.connect(lambda : self.increaseVoltage(self.kpzx))
-        else:
-            self.buttonMoveLeft.clicked.disconnect()
-            self.buttonMoveRight.clicked.disconnect()
-            self.buttonMoveLeft.clicked.connect(lambda : self.increaseVoltage(self.kpzx))
-            self.buttonMoveRight.clicked.connect(lambda : self.decreaseVoltage(self.kpzx))
-        self.direction_stateX = not self.direction_stateX
-        
-    def switchDirectionY(self, device):
-        """
-        Same as above, but for Y direction.
-        """
-        if self.direction_stateY == True:
-            self.buttonMoveUp.clicked.disconnect()
-            self.buttonMoveDown.clicked.disconnect()
-            self.buttonMoveUp.clicked.connect(lambda : self.decreaseVoltage(self.kpzy))
-            self.buttonMoveDown.clicked.connect(lambda : self.increaseVoltage(self.kpzy))
-        else:
-            self.buttonMoveUp.clicked.disconnect()
-            self.buttonMoveDown.clicked.disconnect()
-            self.buttonMoveUp.clicked.connect(lambda : self.increaseVoltage(self.kpzy))
-            self.buttonMoveDown.clicked.connect(lambda : self.decreaseVoltage(self.kpzy))
-        self.direction_stateY = not self.direction_stateY
+        axis.direction_state = not axis.direction_state
+        self._recheckJogLimit(axis)
         
-    def checkJogLimitX(self):
+    def checkJogLimit(self, axis, current_voltage):
         """
         This is a helper method for the jogging functions, and will enable/
-        disable the d-pad arrow buttons.
-        """
-        if self.KPZ101_x.isConnected():
-            current_voltage = self.KPZ101_x.getVoltage()
-            current_jog = self.KPZ101_x.getJogSteps()
-            max_voltage = self.KPZ101_x.getMaxVoltage()
-            if current_voltage <= current_jog:
-                if self.direction_stateX:
-                    self.buttonMoveRight.setEnabled(False)
-                    self.buttonMoveLeft.setEnabled(True)
-                else:
-                    self.buttonMoveLeft.setEnabled(False)
-                    self.buttonMoveRight.setEnabled(True)
-            elif current_voltage + current_jog >= max_voltage:
-                if self.direction_stateX:
-                    self.buttonMoveLeft.setEnabled(False)
-                    self.buttonMoveRight.setEnabled(True)
-                else:
-                    self.buttonMoveRight.setEnabled(False)
-                    self.buttonMoveLeft.setEnabled(True)
+        disable the d-pad arrow buttons of one axis, so that the voltage
+        cannot be jogged below zero or above the maximum voltage. It is
+        only called when something it depends on changes: the displayed
+        voltage (see _display()), or the jog step, direction or maximum
+        voltage of the axis (see _recheckJogLimit()), so that neither the
+        device nor the limits are re-evaluated on every refresh.
+
+        Parameters
+        ----------
+        axis : Axis
+            The KPZ101 and corresponding voltage lcd display
+        current_voltage : float
+            The voltage that was just read from the axis' device
+        """
+        if axis.max_v is not None:
+            current_jog = axis.jog
+            max_voltage = axis.max_v
+            
+            if axis.direction_state:
+                buttonUp, buttonDown = axis.buttonForward, axis.buttonReverse
             else:
-                self.buttonMoveRight.setEnabled(True)
-                self.buttonMoveLeft.setEnabled(True)
+                buttonUp, buttonDown = axis.buttonReverse, axis.buttonForward
+            
+            at_min = current_voltage <= current_jog
+            at_max = not at_min and current_voltage + current_jog >= max_voltage
+            self._setButtonEnabled(buttonDown, not at_min)
+            self._setButtonEnabled(buttonUp, not at_max)
             
-    def checkJogLimitY(self):
+    def _recheckJogLimit(self, axis):
         """
-        (Same as above, but for Y direction)
-        This is a helper method for the jogging functions, and will enable/
-        disable the d-pad arrow buttons.
-        """
-        if self.KPZ101_y.isConnected():
-            current_voltage = self.KPZ101_y.getVoltage()
-            current_jog = self.KPZ101_y.getJogSteps()
-            max_voltage = self.KPZ101_y.getMaxVoltage()
-            if current_voltage <= current_jog:
-                if self.direction_stateY:
-                    self.buttonMoveDown.setEnabled(False)
-                    self.buttonMoveUp.setEnabled(True)
-                else:
-                    self.buttonMoveUp.setEnabled(False)
-                    self.buttonMoveDown.setEnabled(True)
-            elif current_voltage + current_jog >= max_voltage:
-                if self.direction_stateY:
-                    self.buttonMoveUp.setEnabled(False)
-                    self.buttonMoveDown.setEnabled(True)
-                else:
-                    self.buttonMoveDown.setEnabled(False)
-                    self.buttonMoveUp.setEnabled(True)
-            else:
-                self.buttonMoveUp.setEnabled(True)
-                self.buttonMoveDown.setEnabled(True)
+        Re-evaluates the jog limits of the axis for the voltage on display,
+        after its jog step, direction or maximum voltage has changed.
+        """
+        if axis.last_v is not None:
+            self.checkJogLimit(axis, axis.last_v)
+            
+    def _setButtonEnabled(self, button, enabled):
+        """
+        Enables/disables button, skipping the call (and the widget update
+        that comes with it) if button is already in that state.
+        """
+        if self._last_enables.get(button) != enabled:
+            self._last_enables[button] = enabled
+            button.setEnabled(enabled)
         
     def openPopup(self):
         """
-        Opens the serial number adjustment pop-up window.
+        Opens the serial number adjustment pop-up window. The window is only
+        built the first time it is opened, and is re-used afterwards.
         """
-        self.popupWindow = SerialNumberPopup()
+        if self.popupWindow is None:
+            self.popupWindow = SerialNumberPopup()
+            self.popupWindow.saveClicked.connect(self.saveFromPopup)
+            # Set the main window to re-start when the pop-up closes
+            self.popupWindow.setCloseEvent(self._resumeRefresh)
         self.popupWindow.setSerials(self.serial_x, self.serial_y)
-        self.popupWindow.saveClicked.connect(self.saveFromPopup)
-        # Set the main window to pause while the pop-up is open, then to 
-        #   re-start when the pop-up closes
+        # Set the main window to pause while the pop-up is open
         self.timer.stop()
-        self.popupWindow.setCloseEvent(lambda : self.timer.start(1000))
         self.popupWindow.show()
         
     ##============================================
@@ -595,16 +1173,32 @@ class Ui(QtWidgets.QMainWindow):
         new_serials : List(String)
             DESCRIPTION.
         """
-        serials = [self.KPZ101_x.getSerial(), self.KPZ101_y.getSerial()]
+        if self._connecting: # Saved again while the KPZs are re-connecting
+            return
+        # The serial numbers the KPZs were created with (so the devices
+        #   themselves do not have to be asked from the GUI thread)
+        serials = [self.KPZ101_x.serial_no, self.KPZ101_y.serial_no]
        # for i in range(2):
        #     if new_serials[i] != serials[i]:
         if new_serials != serials:
-            self.KPZ101_x.stop()
-            self.KPZ101_y.stop()
-            
-            self.initializeKPZs(new_serials[0], new_serials[1])
-            self.resetConnections()
-            self.setupConnections()
+            # The KPZs are stopped on their pools, after any commands that
+            #   are still queued for them, and the new ones are initialized
+            #   by _onStopped() once both have been stopped
+            self._connecting = True # Also keeps the refresh paused
+            self.centralwidget.setEnabled(False)
+            self.statusbar.showMessage('Stopping the piezo controllers...')
+            # A voltage entered just before saving is not sent any more, as
+            #   it would be queued behind the stop() of the old KPZ
+            self.set_v_timer_x.stop()
+            self.set_v_timer_y.stop()
+            self._stopping = {self.axisX, self.axisY}
+            for axis in (self.axisX, self.axisY):
+                axis.connected = False # No more voltage reads for it
+                axis.pending_v = None
+                stopped = partial(self._onStopped, axis, new_serials)
+                self._submit(axis, axis.kpz.stop, read=False,
+                             done=stopped, failed=stopped)
+            return
             
         self.saveSerials(new_serials[0], new_serials[1])
         """
@@ -613,22 +1207,105 @@ class Ui(QtWidgets.QMainWindow):
         i = 0 replaces x, 1 replaces y. Then, re-write the json
         with the serial #s that are currently attached.
         """
+        
+    def _onStopped(self, axis, new_serials, *result):
+        """
+        Once saveFromPopup() has stopped both of the old KPZs (whether or not
+        stop() succeeded), initializes the KPZs for new_serials and saves
+        them.
+        """
+        self._stopping.discard(axis)
+        if self._stopping: # Still waiting for the other KPZ
+            return
+        self.initializeKPZs(new_serials[0], new_serials[1])
+        self.resetConnections()
+        self.setupConnections()
+        self._pollBoth() # Show the new KPZs straight away
+        self.saveSerials(new_serials[0], new_serials[1])
 
     
+    def changeEvent(self, event):
+        """
+        Stops refreshing the voltages while the window is minimized, since
+        nothing is being shown, and refreshes them straight away once the
+        window is restored (unless the serial number pop-up is open).
+        """
+        if event.type() == QtCore.QEvent.WindowStateChange \
+                and not self._connecting: # (The timer starts afterwards)
+            if self.isMinimized():
+                self.timer.stop()
+            elif not self.timer.isActive() and not self._popupOpen():
+                self._resumeRefresh()
+        super().changeEvent(event)
+        
+    def _waitForTasks(self):
+        """
+        Waits until the running (and queued) KpzTasks of both devices have
+        finished.
+        """
+        self.pool_x.waitForDone()
+        self.pool_y.waitForDone()
+        
+    def _anyConnected(self):
+        """
+        Returns whether at least one of the devices is connected, i.e. whether
+        there is anything for the timer to refresh.
+        """
+        return self.axisX.connected or self.axisY.connected
+        
+    def _canRefresh(self):
+        """
+        Returns whether the timer should be running: at least one device is
+        connected, and the refresh is not paused for the pop-up or the
+        minimized window.
+        """
+        return (self._anyConnected() and not self.isMinimized()
+                and not self._popupOpen())
+        
+    def _popupOpen(self):
+        """
+        Returns whether the serial number pop-up is currently shown, during
+        which the refresh stays paused.
+        """
+        return self.popupWindow is not None and self.popupWindow.isVisible()
+        
+    def _resumeRefresh(self):
+        """
+        Restarts the refresh timer after it was paused (by the pop-up or by
+        minimizing the window), and refreshes both axes straight away.
+        
+        Nothing is done while the KPZs are being stopped/re-connected (e.g.
+        if the pop-up is closed meanwhile), as the axes still belong to the
+        old KPZs; setupConnections() starts the timer again afterwards. The
+        timer also stays stopped while both devices are disconnected (see
+        disconnectPiezo()).
+        """
+        if self._connecting or not self._anyConnected():
+            return
+        self.timer.start(self.poll_interval)
+        self._pollBoth()
+    
     def closeEvent(self, event):
         """
-        Stops the devices completely upon closing of the window.
+        Stops the devices completely upon closing of the window. The window
+        can not be closed while the devices are still being connected.
         """
-        if not self.KPZ101_x.isConnected():
-            self.KPZ101_x.connect()
+        if self._connecting:
+            event.ignore()
+            return
+        self.timer.stop()
+        self.active_timer.stop()
+        self.set_v_timer_x.stop()
+        self.set_v_timer_y.stop()
+        self._waitForTasks()
+        # stop() re-connects a disconnected device itself, if it still has
+        #   to be disabled
         self.KPZ101_x.stop()
-        if not self.KPZ101_y.isConnected():
-            self.KPZ101_y.connect()
         self.KPZ101_y.stop()
         event.accept()
         print('App closed')
         
-class SerialNumberPopup(QtWidgets.QWidget):
+class SerialNumberPopup(QtWidgets.QWidget, Ui_Form):
     """
     The Widget class for the popup to prompt a change in connected piezo
     to the software
@@ -653,15 +1330,16 @@ class SerialNumberPopup(QtWidgets.QWidget):
     
     def __init__(self):
         super().__init__()
-        uic.loadUi('gui_popup_window.ui', self)
+        self.setupUi(self)
         
-        onlyInt = QtGui.QIntValidator()
-        onlyInt.setRange(0, 99999999)
+        # Only allow 8-digit serial numbers to be entered
+        onlySerial = QtGui.QRegularExpressionValidator(
+            QtCore.QRegularExpression(r'\d{8}'), self)
         
         self.lineEditX.editingFinished.connect(self.inputLineEditX)
-        self.lineEditX.setValidator(onlyInt)
+        self.lineEditX.setValidator(onlySerial)
         self.lineEditY.editingFinished.connect(self.inputLineEditY)
-        self.lineEditY.setValidator(onlyInt)
+        self.lineEditY.setValidator(onlySerial)
         self.buttonSave.clicked.connect(self.saveSerials)
         self.buttonCancel.clicked.connect(self.close)
     
@@ -7,6 +7,9 @@ Piezo Controller control, however it may be used by itself for KPZ101 control
 in Python software - Simply comment out the catchNotEnoughDevices() method,
 as this is only for use with the GUI.
 
+For scripts that move two devices together (e.g. x and y), setVoltageXY()
+sets both voltages and then waits for both of them to settle together.
+
 All information is found from the Thorlabs Motion Control Dot Net API
 reference information, which can be located in the Thorlabs/Kinesis directory
 on the computer.
@@ -16,23 +19,107 @@ https://github.com/Thorlabs/Motion_Control_Examples.
 
 @author: Anya Dovgal
 """
-import os
 import time
-import sys
-import clr
-
-clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\Thorlabs.MotionControl.DeviceManagerCLI.dll")
-clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\Thorlabs.MotionControl.GenericMotorCLI.dll")
-clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\ThorLabs.MotionControl.KCube.PiezoCLI.dll")
-clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\ThorLabs.MotionControl.GenericPiezoCLI.dll")
-from Thorlabs.MotionControl.DeviceManagerCLI import *
-from Thorlabs.MotionControl.GenericMotorCLI import *
-from Thorlabs.MotionControl.KCube.PiezoCLI import *
-from Thorlabs.MotionControl.GenericPiezoCLI import Piezo
-import Thorlabs.MotionControl.GenericPiezoCLI.Settings as Settings
-from System import Decimal  # necessary for real world units
-
-from Exceptions import *
+import functools
+import threading
+
+from Exceptions import MisMatchSerialError, DeviceCountError
+
+# The Kinesis .NET types, loaded by _ensureClrLoaded() when they are first
+#   needed, so that importing this module does not start up the CLR
+DeviceManagerCLI = None
+KCubePiezo = None
+Settings = None
+Decimal = None  # System.Decimal, necessary for real world units
+Convert = None
+_DEC_ZERO = None # Decimal(0), built once rather than on every bounds check
+_JOG_UP = None   # PiezoJogDirection.Increase/Decrease, resolved once rather
+_JOG_DOWN = None #   than on every jog
+_CLR_READY = False
+_CLR_LOCK = threading.Lock()
+
+def _ensureClrLoaded():
+    """
+    Loads the Thorlabs Kinesis .dll files through pythonnet and imports the
+    .NET types used in this module, the first time it is called.
+    """
+    global DeviceManagerCLI, KCubePiezo, Settings, Decimal, Convert
+    global _DEC_ZERO, _JOG_UP, _JOG_DOWN, _CLR_READY
+    if _CLR_READY:
+        return
+    with _CLR_LOCK:
+        if _CLR_READY: # Loaded by another thread in the meantime
+            return
+        import clr
+        
+        clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\Thorlabs.MotionControl.DeviceManagerCLI.dll")
+        clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\Thorlabs.MotionControl.GenericMotorCLI.dll")
+        clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\ThorLabs.MotionControl.KCube.PiezoCLI.dll")
+        clr.AddReference("C:\\Program Files\\Thorlabs\\Kinesis\\ThorLabs.MotionControl.GenericPiezoCLI.dll")
+        from Thorlabs.MotionControl.DeviceManagerCLI import DeviceManagerCLI
+        from Thorlabs.MotionControl.KCube.PiezoCLI import KCubePiezo
+        import Thorlabs.MotionControl.GenericPiezoCLI.Settings as Settings
+        from System import Decimal, Convert
+        
+        _DEC_ZERO = Decimal(0)
+        _JOG_UP = Settings.ControlSettings.PiezoJogDirection.Increase
+        _JOG_DOWN = Settings.ControlSettings.PiezoJogDirection.Decrease
+        _CLR_READY = True
+
+@functools.lru_cache(maxsize=64)
+def _toDecimal(value):
+    """
+    Returns value (a float) as a System.Decimal. The Decimals of recently
+    used values are kept, so that entering the same voltage/jog step again
+    does not construct a new one.
+    """
+    return Decimal(value)
+
+POLLING_RATE = 250 # ms, how often the device refreshes its own status
+SETTLE_TIMEOUT = 1 # s, the longest setVoltage() waits for the new voltage
+SETTLE_TOLERANCE = 0.01 # V, how close the voltage must be to count as set
+MAX_JOG_STEP = 10 # V, the largest voltage jog step setJogSteps() accepts
+SETTLE_STEP = POLLING_RATE / 1000 # s, time between voltage checks while
+                                  #   waiting (the voltage read from the
+                                  #   device only changes once per poll)
+_DEVICE_SERIALS = None # Serial numbers in the device list, once it is built
+_DEVICE_LIST_LOCK = threading.Lock() # Held while the list is (re)built
+
+def buildDeviceList(rebuild=False):
+    """
+    Has the Kinesis device manager look for the connected devices, and
+    reads their serial numbers from it. This is only done the first time it
+    is called (or when rebuild == True), so that several KPZ101 objects being
+    created do not each rebuild and re-read the list. A KPZ101 whose serial
+    number is not in the list rebuilds it itself, in case its device has been
+    plugged in since.
+
+    Parameters
+    ----------
+    rebuild : Boolean, optional
+        Rebuild the list even if it has already been built, e.g. to pick up
+        devices that were plugged in since. The default is False.
+
+    Returns
+    -------
+    None.
+
+    """
+    global _DEVICE_SERIALS
+    _ensureClrLoaded()
+    with _DEVICE_LIST_LOCK: # Two KPZ101s may be created at the same time
+        if rebuild or _DEVICE_SERIALS is None:
+            DeviceManagerCLI.BuildDeviceList()
+            _DEVICE_SERIALS = tuple(str(serial) for serial
+                                    in DeviceManagerCLI.GetDeviceList())
+        
+def deviceSerials():
+    """
+    Returns the serial numbers of the devices found by buildDeviceList() as a
+    tuple of strings, building the device list first if it has not been yet.
+    """
+    buildDeviceList()
+    return _DEVICE_SERIALS
 
 class KPZ101:  
     """
@@ -47,7 +134,8 @@ class KPZ101:
         The KPZ101 device associated with a given serial number
         with which it is initialized
     max_voltage : Decimal
-        The maximum voltage that the device may reach
+        The maximum voltage that the device may reach (read once, at
+        initialization, as it does not change)
     cvoltage : Decimal
         The current voltage of the KPZ101 device
     jogsteps : ControlSettings::JogStepsStruct
@@ -60,18 +148,29 @@ class KPZ101:
     --------
     getVoltage()
     getVoltageFloat(int rounding)
-        Returns the current device voltage as a float, rounded to rounding digits
+        Returns cvoltage (the device voltage as of the last update()) as a
+        float, rounded to rounding digits
     getMaxVoltage()
+    getMaxVoltageFloat(int rounding)
     getJogSteps()
+    getJogStepsFloat(int rounding)
+    isConnected()
+        Returns whether the device is connected, as last set by this object
+    refreshState()
+        Re-reads the connection state from the device itself
     update()
         Updates the cvoltage, mainly to reduce redundancy
     setZero()
         Sets the zero for the KPZ101 device
-    setVoltage(Decimal voltage)
+    setVoltage(float voltage)
         Sets the current voltage to the new 'voltage',
         0 < voltage < max_voltage
         --> Note-to-self: voltage is changed almost immediately.
-    setJogSteps(Decimal new_step)
+    sendVoltage(float voltage)
+        setVoltage() without the wait for the voltage to settle
+    waitForVoltage(float target, float timeout = SETTLE_TIMEOUT)
+        Waits until the device voltage has reached target
+    setJogSteps(float new_step)
         Sets the voltage jog step to new_step
         0 < new_step < 10
     jogVoltage(Boolean boolean)
@@ -101,6 +200,13 @@ class KPZ101:
     stop()
         Disables, stops polling, and disconnects the device completely.
     """
+    # The attributes are fixed, so there is no need for a per-instance
+    #   __dict__ (and a misspelt attribute raises an error instead of
+    #   silently creating a new one)
+    __slots__ = ('serial_no', 'device', '_set_output_voltage', '_connected',
+                 '_settings_ready', 'max_voltage', '_max_voltage_float',
+                 '_serial', 'jogsteps', '_jog_step_float', 'cvoltage',
+                 '_enabled')
     
     def __init__(self, serial_no):
         """
@@ -121,19 +227,30 @@ class KPZ101:
 
         """
         
+        _ensureClrLoaded()
         self.serial_no = serial_no
         
-        # Building Devices
-        DeviceManagerCLI.BuildDeviceList()
+        # Building Devices (if that has not been done already, or if the
+        #   device is not in the list, e.g. because it was plugged in since)
+        buildDeviceList()
+        if serial_no not in deviceSerials():
+            buildDeviceList(rebuild=True)
         self.catchNotEnoughDevices()
         self.catchMisMatchedSerial()
         
         # Check Device is being registered by computer
-        if DeviceManagerCLI.GetDeviceListSize() < 1:
+        if len(deviceSerials()) < 1:
             raise Exception('No Device Available')
             
         # Created KCubePiezo device
         self.device = KCubePiezo.CreateKCubePiezo(serial_no)
+        # Resolve the Decimal overload of SetOutputVoltage once, instead of
+        #   having pythonnet pick the overload on every call
+        self._set_output_voltage = self.device.SetOutputVoltage.Overloads[Decimal]
+        
+        # Connection state, as last set by this object (see refreshState())
+        self._connected = False
+        self._settings_ready = False
         
         self.initialConnect()
         
@@ -141,55 +258,86 @@ class KPZ101:
         
         #======================================================
         self.max_voltage = self.device.GetMaxOutputVoltage()
+        self._max_voltage_float = Convert.ToDouble(self.max_voltage)
+        self._serial = None # Read from the device by the first getSerial()
         self.jogsteps = self.device.GetJogSteps()
+        # Only changed by setJogSteps(), so the float is kept rather than
+        #   converted from jogsteps on every call
+        self._jog_step_float = Convert.ToDouble(self.jogsteps.VoltageStepSize)
         self.cvoltage = self.device.GetOutputVoltage()
         
+        # Whether the output was last enabled (True) or disabled by this
+        #   object, so stop() knows if a disconnected device still needs it
+        self._enabled = True
+        
     def catchNotEnoughDevices(self):
-        i = DeviceManagerCLI.GetDeviceListSize()
+        i = len(deviceSerials())
         if i <= 1:
             raise DeviceCountError(i)
         
     def catchMisMatchedSerial(self):
-        if not DeviceManagerCLI.IsDeviceConnected(self.serial_no):
-            connected = [DeviceManagerCLI.GetDeviceList()[0], DeviceManagerCLI.GetDeviceList()[1]]
+        connected = deviceSerials()
+        if self.serial_no not in connected:
             raise MisMatchSerialError(self.serial_no, connected)
         
     def getSerial(self):
-        deviceInfo = self.device.GetDeviceInfo()
-        return str(deviceInfo.SerialNumber)
+        if self._serial is None:
+            deviceInfo = self.device.GetDeviceInfo()
+            self._serial = str(deviceInfo.SerialNumber)
+        return self._serial
         
     def getVoltage(self):
         return self.cvoltage
     
+    # The ...Float getters convert the Decimals with Convert.ToDouble() on the
+    #   .NET side, rather than formatting them to a string and parsing that
     def getVoltageFloat(self, rounding):
-        return round(float(self.device.GetOutputVoltage().ToString()), rounding)
+        return round(Convert.ToDouble(self.cvoltage), rounding)
     
     def getMaxVoltage(self):
-        return self.device.GetMaxOutputVoltage()
+        return self.max_voltage
+    
+    def getMaxVoltageFloat(self, rounding):
+        return round(self._max_voltage_float, rounding)
         
     def getJogSteps(self):
         return self.jogsteps.VoltageStepSize
     
     def getJogStepsFloat(self, rounding):
-        return round(float(self.jogsteps.VoltageStepSize.ToString()), rounding)
+        return round(self._jog_step_float, rounding)
     
     def isConnected(self):
-        return self.device.IsConnected
+        return self._connected
+    
+    def refreshState(self):
+        """
+        Re-reads whether the device is connected from the device itself, for
+        when the cached state may be out of date (e.g. after an error), and
+        returns it.
+        """
+        self._connected = bool(self.device.IsConnected)
+        if not self._connected:
+            self._settings_ready = False
+        return self._connected
     
     def initialConnect(self):
         # TODO: Simplify this method with self.connect()
-        if not self.device.IsConnected:
+        if not self._connected:
             self.device.Connect(self.serial_no)
             assert self.device.IsConnected is True
+            self._connected = True
             
-        self.device.StartPolling(250)
+        self.device.StartPolling(POLLING_RATE)
         time.sleep(0.5)
         self.device.EnableDevice()
+        self._enabled = True
         time.sleep(0.25)
         
-        if not self.device.IsSettingsInitialized():
-            self.device.WaitForSettingsInitialized(10000)  # 10 second timeout
-            assert self.device.IsSettingsInitialized() is True
+        if not self._settings_ready:
+            if not self.device.IsSettingsInitialized():
+                self.device.WaitForSettingsInitialized(10000)  # 10 second timeout
+                assert self.device.IsSettingsInitialized() is True
+            self._settings_ready = True
     
     def update(self):
         """
@@ -217,21 +365,72 @@ class KPZ101:
     def setVoltage(self, voltage):
         """
         Given 0 <= voltage <= max_voltage, update the output voltage of the
-        KPZ101 device to 'voltage'
+        KPZ101 device to 'voltage', and wait (up to SETTLE_TIMEOUT) until the
+        device reports that it has reached it
 
         Parameters
         ----------
-        voltage : Decimal
-            The user-input voltage to be set as the new output voltage
+        voltage : float
+            The user-input voltage to be set as the new output voltage,
+            converted to a Decimal here
 
         Returns
         -------
         None.
 
         """
-        if voltage >= Decimal(0) and voltage <= self.max_voltage:
-            self.device.SetOutputVoltage(voltage)
-            time.sleep(1)
+        if self.sendVoltage(voltage):
+            self.waitForVoltage(voltage)
+            
+    def waitForVoltage(self, target, timeout=SETTLE_TIMEOUT):
+        """
+        Waits until the output voltage of the device is within
+        SETTLE_TOLERANCE of target, checking every SETTLE_STEP seconds, so
+        that a small step does not wait as long as a full-scale one.
+
+        Parameters
+        ----------
+        target : float
+            The voltage that was sent to the device
+        timeout : float, optional
+            The longest time to wait, in s. The default is SETTLE_TIMEOUT.
+
+        Returns
+        -------
+        bool
+            True if the voltage was reached before the timeout
+
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self.update()
+            if abs(Convert.ToDouble(self.cvoltage) - target) < SETTLE_TOLERANCE:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(SETTLE_STEP)
+            
+    def sendVoltage(self, voltage):
+        """
+        Same as setVoltage(), but returns straight after sending the new
+        output voltage, without waiting for the device to settle.
+
+        Parameters
+        ----------
+        voltage : float
+            The user-input voltage to be set as the new output voltage
+
+        Returns
+        -------
+        bool
+            True if the voltage was within range and has been sent
+
+        """
+        # Range-checked as a float, so no Decimal is needed for a rejection
+        if 0 <= voltage <= self._max_voltage_float:
+            self._set_output_voltage(_toDecimal(voltage))
+            return True
+        return False
         
     def setJogSteps(self, new_step):
         """
@@ -239,18 +438,22 @@ class KPZ101:
 
         Parameters
         ----------
-        new_step : Decimal
+        new_step : float
             The user-input VOLTAGE jog step to be set as the new current
-            VOLTAGE jog step for the device
+            VOLTAGE jog step for the device, converted to a Decimal here
 
         Returns
         -------
         None.
 
         """
-        if new_step >= Decimal(0) and new_step <= Decimal(10):
+        # Range-checked as a float, so no Decimal is needed for a rejection
+        #   (and nan/inf/huge values never reach the Decimal constructor)
+        if 0 <= new_step <= MAX_JOG_STEP:
+            new_step = _toDecimal(new_step)
             self.jogsteps.VoltageStepSize = new_step
             self.device.SetJogSteps(self.jogsteps)
+            self._jog_step_float = Convert.ToDouble(new_step)
             time.sleep(0.25)
         
     def jogVoltage(self, boolean):
@@ -269,14 +472,8 @@ class KPZ101:
         None.
 
         """
-        Increase = Settings.ControlSettings.PiezoJogDirection.Increase
-        Decrease = Settings.ControlSettings.PiezoJogDirection.Decrease
-        if self.cvoltage >= Decimal(0) and self.cvoltage <= self.max_voltage:
-            if boolean:
-                self.device.Jog(Increase)
-                
-            else:
-                self.device.Jog(Decrease)
+        if self.cvoltage >= _DEC_ZERO and self.cvoltage <= self.max_voltage:
+            self.device.Jog(_JOG_UP if boolean else _JOG_DOWN)
                 
     def disconnect(self):
         """
@@ -287,10 +484,12 @@ class KPZ101:
         None.
 
         """
-        if self.device.IsConnected:
+        if self._connected:
             self.device.StopPolling()
             time.sleep(1)
             self.device.Disconnect(False)
+            self._connected = False
+            self._settings_ready = False
         
     def connect(self):        
         """
@@ -302,18 +501,22 @@ class KPZ101:
         None.
 
         """
-        if not self.device.IsConnected:
+        if not self._connected:
             self.device.ConnectDevice(self.serial_no)
             assert self.device.IsConnected is True
+            self._connected = True
             
-        self.device.StartPolling(250)
+        self.device.StartPolling(POLLING_RATE)
         time.sleep(0.5)
         self.device.EnableDevice()
+        self._enabled = True
         time.sleep(0.25)
         
-        if not self.device.IsSettingsInitialized():
-            self.device.WaitForSettingsInitialized(10000)  # 10 second timeout
-            assert self.device.IsSettingsInitialized() is True
+        if not self._settings_ready:
+            if not self.device.IsSettingsInitialized():
+                self.device.WaitForSettingsInitialized(10000)  # 10 second timeout
+                assert self.device.IsSettingsInitialized() is True
+            self._settings_ready = True
         
     def disable(self):
         """
@@ -325,6 +528,7 @@ class KPZ101:
 
         """
         self.device.DisableDevice()
+        self._enabled = False
         time.sleep(0.25)
         
     def enable(self):
@@ -338,16 +542,53 @@ class KPZ101:
 
         """
         self.device.EnableDevice()
+        self._enabled = True
         time.sleep(0.25)
         
     def stop(self):
         """
         Completely disconnect and disable the KPZ101 Device from the software
+        
+        A device that is already disconnected and disabled is left alone. If
+        it was disconnected while still enabled, it is re-connected (without
+        re-enabling it) just long enough to disable its output.
 
         Returns
         -------
         None.
 
         """
+        if not self._connected:
+            if not self._enabled:
+                return
+            self.device.ConnectDevice(self.serial_no)
+            self._connected = True
         self.disable()
-        self.disconnect()
\ No newline at end of file
+        self.disconnect()
+        
+def setVoltageXY(kpz_x, kpz_y, voltage_x, voltage_y):
+    """
+    Sets the output voltages of two KPZ101 devices (e.g. the x and y piezos)
+    back-to-back, and then waits for both of them to settle within the one
+    SETTLE_TIMEOUT, rather than one after the other as two setVoltage() calls
+    would.
+
+    Parameters
+    ----------
+    kpz_x, kpz_y : KPZ101
+        The two devices
+    voltage_x, voltage_y : float
+        The new output voltages, each 0 <= voltage <= max_voltage
+
+    Returns
+    -------
+    None.
+
+    """
+    sent_x = kpz_x.sendVoltage(voltage_x)
+    sent_y = kpz_y.sendVoltage(voltage_y)
+    deadline = time.monotonic() + SETTLE_TIMEOUT
+    if sent_x:
+        kpz_x.waitForVoltage(voltage_x)
+    if sent_y:
+        kpz_y.waitForVoltage(voltage_y, max(deadline - time.monotonic(), 0))
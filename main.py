@@ -27,13 +27,10 @@ if the kernel is not restarted.
 #    pip install ctypes
 # NI-Visa and Thorlabs Kinesis should also be installed and up-to-date
 
-import os
 import sys
-import json
 
-from PyQt5 import QtWidgets, uic
+from PyQt5 import QtWidgets
 
-#from KPZ101 import KPZ101
 from GUI import Ui
 
 #%%
@@ -41,13 +38,13 @@ from GUI import Ui
 def main():
     """ Starts the application for Piezo Controller control.
     """
-    startGUI() 
+    return startGUI()
         
         
 def startGUI():
     app = QtWidgets.QApplication(sys.argv)
     window = Ui()
-    app.exec_()
+    return app.exec_() # The exit code of the event loop
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui_v2.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(880, 670)
+        MainWindow.setMinimumSize(QtCore.QSize(880, 670))
+        MainWindow.setMaximumSize(QtCore.QSize(880, 670))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(30, 30, 811, 571))
+        self.frame.setFrameShape(QtWidgets.QFrame.Panel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.frame.setLineWidth(5)
+        self.frame.setMidLineWidth(0)
+        self.frame.setObjectName("frame")
+        self.frameX = QtWidgets.QFrame(self.frame)
+        self.frameX.setGeometry(QtCore.QRect(20, 20, 200, 530))
+        self.frameX.setFrameShape(QtWidgets.QFrame.Box)
+        self.frameX.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameX.setObjectName("frameX")
+        self.buttonDisconnectX = QtWidgets.QPushButton(self.frameX)
+        self.buttonDisconnectX.setGeometry(QtCore.QRect(40, 465, 120, 35))
+        self.buttonDisconnectX.setObjectName("buttonDisconnectX")
+        self.buttonSetZeroX = QtWidgets.QPushButton(self.frameX)
+        self.buttonSetZeroX.setGeometry(QtCore.QRect(40, 185, 120, 35))
+        self.buttonSetZeroX.setAutoFillBackground(False)
+        self.buttonSetZeroX.setAutoRepeat(False)
+        self.buttonSetZeroX.setDefault(False)
+        self.buttonSetZeroX.setFlat(False)
+        self.buttonSetZeroX.setObjectName("buttonSetZeroX")
+        self.buttonConnectX = QtWidgets.QPushButton(self.frameX)
+        self.buttonConnectX.setGeometry(QtCore.QRect(40, 465, 120, 35))
+        self.buttonConnectX.setAutoExclusive(False)
+        self.buttonConnectX.setObjectName("buttonConnectX")
+        self.lineEditSetVX = QtWidgets.QLineEdit(self.frameX)
+        self.lineEditSetVX.setGeometry(QtCore.QRect(45, 150, 110, 25))
+        self.lineEditSetVX.setObjectName("lineEditSetVX")
+        self.label_setJ_x = QtWidgets.QLabel(self.frameX)
+        self.label_setJ_x.setGeometry(QtCore.QRect(40, 270, 80, 20))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_setJ_x.setFont(font)
+        self.label_setJ_x.setObjectName("label_setJ_x")
+        self.currentVoltage_5 = QtWidgets.QLabel(self.frameX)
+        self.currentVoltage_5.setGeometry(QtCore.QRect(160, 100, 20, 50))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.currentVoltage_5.setFont(font)
+        self.currentVoltage_5.setObjectName("currentVoltage_5")
+        self.buttonDisableX = QtWidgets.QPushButton(self.frameX)
+        self.buttonDisableX.setGeometry(QtCore.QRect(40, 420, 120, 35))
+        self.buttonDisableX.setObjectName("buttonDisableX")
+        self.label_setV_x = QtWidgets.QLabel(self.frameX)
+        self.label_setV_x.setGeometry(QtCore.QRect(40, 80, 70, 20))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_setV_x.setFont(font)
+        self.label_setV_x.setObjectName("label_setV_x")
+        self.buttonEnableX = QtWidgets.QPushButton(self.frameX)
+        self.buttonEnableX.setGeometry(QtCore.QRect(40, 420, 120, 35))
+        self.buttonEnableX.setObjectName("buttonEnableX")
+        self.label_x_direction = QtWidgets.QLabel(self.frameX)
+        self.label_x_direction.setGeometry(QtCore.QRect(20, 10, 120, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_x_direction.setFont(font)
+        self.label_x_direction.setWordWrap(False)
+        self.label_x_direction.setObjectName("label_x_direction")
+        self.lcdNumberCVX = QtWidgets.QLCDNumber(self.frameX)
+        self.lcdNumberCVX.setGeometry(QtCore.QRect(45, 110, 110, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lcdNumberCVX.setFont(font)
+        self.lcdNumberCVX.setSmallDecimalPoint(False)
+        self.lcdNumberCVX.setMode(QtWidgets.QLCDNumber.Dec)
+        self.lcdNumberCVX.setObjectName("lcdNumberCVX")
+        self.currentVoltage_3 = QtWidgets.QLabel(self.frameX)
+        self.currentVoltage_3.setGeometry(QtCore.QRect(160, 290, 20, 50))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.currentVoltage_3.setFont(font)
+        self.currentVoltage_3.setObjectName("currentVoltage_3")
+        self.lcdNumberCJX = QtWidgets.QLCDNumber(self.frameX)
+        self.lcdNumberCJX.setGeometry(QtCore.QRect(45, 300, 110, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lcdNumberCJX.setFont(font)
+        self.lcdNumberCJX.setSmallDecimalPoint(False)
+        self.lcdNumberCJX.setMode(QtWidgets.QLCDNumber.Dec)
+        self.lcdNumberCJX.setObjectName("lcdNumberCJX")
+        self.lineEditSetJX = QtWidgets.QLineEdit(self.frameX)
+        self.lineEditSetJX.setGeometry(QtCore.QRect(45, 340, 110, 25))
+        self.lineEditSetJX.setObjectName("lineEditSetJX")
+        self.frameY = QtWidgets.QFrame(self.frame)
+        self.frameY.setGeometry(QtCore.QRect(230, 20, 200, 530))
+        self.frameY.setFrameShape(QtWidgets.QFrame.Box)
+        self.frameY.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameY.setObjectName("frameY")
+        self.buttonConnectY = QtWidgets.QPushButton(self.frameY)
+        self.buttonConnectY.setGeometry(QtCore.QRect(40, 465, 120, 35))
+        self.buttonConnectY.setAutoExclusive(False)
+        self.buttonConnectY.setObjectName("buttonConnectY")
+        self.lineEditSetVY = QtWidgets.QLineEdit(self.frameY)
+        self.lineEditSetVY.setGeometry(QtCore.QRect(45, 150, 110, 25))
+        self.lineEditSetVY.setObjectName("lineEditSetVY")
+        self.buttonDisableY = QtWidgets.QPushButton(self.frameY)
+        self.buttonDisableY.setGeometry(QtCore.QRect(40, 420, 120, 35))
+        self.buttonDisableY.setObjectName("buttonDisableY")
+        self.buttonSetZeroY = QtWidgets.QPushButton(self.frameY)
+        self.buttonSetZeroY.setGeometry(QtCore.QRect(40, 185, 120, 35))
+        self.buttonSetZeroY.setAutoFillBackground(False)
+        self.buttonSetZeroY.setAutoRepeat(False)
+        self.buttonSetZeroY.setDefault(False)
+        self.buttonSetZeroY.setFlat(False)
+        self.buttonSetZeroY.setObjectName("buttonSetZeroY")
+        self.lcdNumberCJY = QtWidgets.QLCDNumber(self.frameY)
+        self.lcdNumberCJY.setGeometry(QtCore.QRect(45, 300, 110, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lcdNumberCJY.setFont(font)
+        self.lcdNumberCJY.setSmallDecimalPoint(False)
+        self.lcdNumberCJY.setMode(QtWidgets.QLCDNumber.Dec)
+        self.lcdNumberCJY.setObjectName("lcdNumberCJY")
+        self.buttonDisconnectY = QtWidgets.QPushButton(self.frameY)
+        self.buttonDisconnectY.setGeometry(QtCore.QRect(40, 465, 120, 35))
+        self.buttonDisconnectY.setObjectName("buttonDisconnectY")
+        self.lineEditSetJY = QtWidgets.QLineEdit(self.frameY)
+        self.lineEditSetJY.setGeometry(QtCore.QRect(45, 340, 110, 25))
+        self.lineEditSetJY.setObjectName("lineEditSetJY")
+        self.label_setJ_Y = QtWidgets.QLabel(self.frameY)
+        self.label_setJ_Y.setGeometry(QtCore.QRect(40, 270, 80, 20))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_setJ_Y.setFont(font)
+        self.label_setJ_Y.setObjectName("label_setJ_Y")
+        self.currentVoltage_4 = QtWidgets.QLabel(self.frameY)
+        self.currentVoltage_4.setGeometry(QtCore.QRect(160, 290, 20, 50))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.currentVoltage_4.setFont(font)
+        self.currentVoltage_4.setObjectName("currentVoltage_4")
+        self.label_setV_y = QtWidgets.QLabel(self.frameY)
+        self.label_setV_y.setGeometry(QtCore.QRect(40, 80, 70, 20))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_setV_y.setFont(font)
+        self.label_setV_y.setObjectName("label_setV_y")
+        self.label_y_direction = QtWidgets.QLabel(self.frameY)
+        self.label_y_direction.setGeometry(QtCore.QRect(20, 10, 120, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_y_direction.setFont(font)
+        self.label_y_direction.setObjectName("label_y_direction")
+        self.buttonEnableY = QtWidgets.QPushButton(self.frameY)
+        self.buttonEnableY.setGeometry(QtCore.QRect(40, 420, 120, 35))
+        self.buttonEnableY.setObjectName("buttonEnableY")
+        self.lcdNumberCVY = QtWidgets.QLCDNumber(self.frameY)
+        self.lcdNumberCVY.setGeometry(QtCore.QRect(45, 110, 110, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lcdNumberCVY.setFont(font)
+        self.lcdNumberCVY.setSmallDecimalPoint(False)
+        self.lcdNumberCVY.setMode(QtWidgets.QLCDNumber.Dec)
+        self.lcdNumberCVY.setObjectName("lcdNumberCVY")
+        self.currentVoltage_6 = QtWidgets.QLabel(self.frameY)
+        self.currentVoltage_6.setGeometry(QtCore.QRect(160, 100, 20, 50))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.currentVoltage_6.setFont(font)
+        self.currentVoltage_6.setObjectName("currentVoltage_6")
+        self.lineEditSetVY.raise_()
+        self.buttonDisableY.raise_()
+        self.buttonSetZeroY.raise_()
+        self.lcdNumberCJY.raise_()
+        self.buttonDisconnectY.raise_()
+        self.lineEditSetJY.raise_()
+        self.label_setJ_Y.raise_()
+        self.currentVoltage_4.raise_()
+        self.label_setV_y.raise_()
+        self.label_y_direction.raise_()
+        self.buttonEnableY.raise_()
+        self.lcdNumberCVY.raise_()
+        self.currentVoltage_6.raise_()
+        self.buttonConnectY.raise_()
+        self.frameJogging = QtWidgets.QFrame(self.frame)
+        self.frameJogging.setGeometry(QtCore.QRect(440, 20, 350, 421))
+        self.frameJogging.setFrameShape(QtWidgets.QFrame.Box)
+        self.frameJogging.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameJogging.setObjectName("frameJogging")
+        self.buttonMoveLeft = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonMoveLeft.setGeometry(QtCore.QRect(25, 130, 100, 70))
+        self.buttonMoveLeft.setAutoFillBackground(False)
+        self.buttonMoveLeft.setAutoRepeat(True)
+        self.buttonMoveLeft.setDefault(False)
+        self.buttonMoveLeft.setFlat(False)
+        self.buttonMoveLeft.setObjectName("buttonMoveLeft")
+        self.buttonMoveDown = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonMoveDown.setGeometry(QtCore.QRect(125, 200, 100, 70))
+        self.buttonMoveDown.setAutoRepeat(True)
+        self.buttonMoveDown.setObjectName("buttonMoveDown")
+        self.buttonMoveUp = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonMoveUp.setGeometry(QtCore.QRect(125, 60, 100, 70))
+        self.buttonMoveUp.setAutoFillBackground(False)
+        self.buttonMoveUp.setAutoRepeat(True)
+        self.buttonMoveUp.setDefault(False)
+        self.buttonMoveUp.setFlat(False)
+        self.buttonMoveUp.setObjectName("buttonMoveUp")
+        self.buttonMoveRight = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonMoveRight.setGeometry(QtCore.QRect(225, 130, 100, 70))
+        self.buttonMoveRight.setAutoRepeat(True)
+        self.buttonMoveRight.setAutoDefault(False)
+        self.buttonMoveRight.setDefault(False)
+        self.buttonMoveRight.setFlat(False)
+        self.buttonMoveRight.setObjectName("buttonMoveRight")
+        self.label_jog_voltage = QtWidgets.QLabel(self.frameJogging)
+        self.label_jog_voltage.setGeometry(QtCore.QRect(20, 10, 151, 31))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_jog_voltage.setFont(font)
+        self.label_jog_voltage.setWordWrap(False)
+        self.label_jog_voltage.setObjectName("label_jog_voltage")
+        self.buttonSwitchX = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonSwitchX.setGeometry(QtCore.QRect(20, 330, 150, 35))
+        self.buttonSwitchX.setObjectName("buttonSwitchX")
+        self.buttonSwitchY = QtWidgets.QPushButton(self.frameJogging)
+        self.buttonSwitchY.setGeometry(QtCore.QRect(20, 370, 150, 35))
+        self.buttonSwitchY.setObjectName("buttonSwitchY")
+        self.frameJogging.raise_()
+        self.frameY.raise_()
+        self.frameX.raise_()
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 880, 31))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        MainWindow.setMenuBar(self.menubar)
+        self.actionChangeSerial = QtWidgets.QAction(MainWindow)
+        self.actionChangeSerial.setObjectName("actionChangeSerial")
+        self.menuFile.addAction(self.actionChangeSerial)
+        self.menubar.addAction(self.menuFile.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.buttonDisconnectX.setText(_translate("MainWindow", "Disconnect"))
+        self.buttonSetZeroX.setText(_translate("MainWindow", "Set Zero"))
+        self.buttonConnectX.setText(_translate("MainWindow", "Connect"))
+        self.label_setJ_x.setText(_translate("MainWindow", "Jog Step"))
+        self.currentVoltage_5.setText(_translate("MainWindow", "V"))
+        self.buttonDisableX.setText(_translate("MainWindow", "Disable"))
+        self.label_setV_x.setText(_translate("MainWindow", "Voltage"))
+        self.buttonEnableX.setText(_translate("MainWindow", "Enable"))
+        self.label_x_direction.setText(_translate("MainWindow", "x direction"))
+        self.currentVoltage_3.setText(_translate("MainWindow", "V"))
+        self.buttonConnectY.setText(_translate("MainWindow", "Connect"))
+        self.buttonDisableY.setText(_translate("MainWindow", "Disable"))
+        self.buttonSetZeroY.setText(_translate("MainWindow", "Set Zero"))
+        self.buttonDisconnectY.setText(_translate("MainWindow", "Disconnect"))
+        self.label_setJ_Y.setText(_translate("MainWindow", "Jog Step"))
+        self.currentVoltage_4.setText(_translate("MainWindow", "V"))
+        self.label_setV_y.setText(_translate("MainWindow", "Voltage"))
+        self.label_y_direction.setText(_translate("MainWindow", "y direction"))
+        self.buttonEnableY.setText(_translate("MainWindow", "Enable"))
+        self.currentVoltage_6.setText(_translate("MainWindow", "V"))
+        self.buttonMoveLeft.setText(_translate("MainWindow", "<"))
+        self.buttonMoveDown.setText(_translate("MainWindow", "v"))
+        self.buttonMoveUp.setText(_translate("MainWindow", "^"))
+        self.buttonMoveRight.setText(_translate("MainWindow", ">"))
+        self.label_jog_voltage.setText(_translate("MainWindow", "Jog Voltage"))
+        self.buttonSwitchX.setText(_translate("MainWindow", "Switch x direction"))
+        self.buttonSwitchY.setText(_translate("MainWindow", "Switch y direction"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.actionChangeSerial.setText(_translate("MainWindow", "Change Piezo Serial #"))
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui_popup_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(340, 250)
+        Form.setMinimumSize(QtCore.QSize(340, 250))
+        Form.setMaximumSize(QtCore.QSize(340, 250))
+        self.frame = QtWidgets.QFrame(Form)
+        self.frame.setGeometry(QtCore.QRect(15, 20, 310, 210))
+        self.frame.setFrameShape(QtWidgets.QFrame.Box)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setGeometry(QtCore.QRect(17, 10, 276, 40))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setWordWrap(True)
+        self.label.setObjectName("label")
+        self.buttonSave = QtWidgets.QPushButton(self.frame)
+        self.buttonSave.setGeometry(QtCore.QRect(20, 160, 120, 35))
+        self.buttonSave.setObjectName("buttonSave")
+        self.lineEditY = QtWidgets.QLineEdit(self.frame)
+        self.lineEditY.setGeometry(QtCore.QRect(150, 110, 120, 25))
+        self.lineEditY.setObjectName("lineEditY")
+        self.lineEditX = QtWidgets.QLineEdit(self.frame)
+        self.lineEditX.setGeometry(QtCore.QRect(150, 70, 120, 25))
+        self.lineEditX.setText("")
+        self.lineEditX.setObjectName("lineEditX")
+        self.buttonCancel = QtWidgets.QPushButton(self.frame)
+        self.buttonCancel.setGeometry(QtCore.QRect(170, 160, 120, 35))
+        self.buttonCancel.setObjectName("buttonCancel")
+        self.label_2 = QtWidgets.QLabel(self.frame)
+        self.label_2.setGeometry(QtCore.QRect(50, 70, 90, 20))
+        self.label_2.setObjectName("label_2")
+        self.label_3 = QtWidgets.QLabel(self.frame)
+        self.label_3.setGeometry(QtCore.QRect(50, 110, 90, 20))
+        self.label_3.setObjectName("label_3")
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.label.setText(_translate("Form", "Adjust the Piezo Controller serial numbers, and save for future use."))
+        self.buttonSave.setText(_translate("Form", "Save"))
+        self.buttonCancel.setText(_translate("Form", "Cancel"))
+        self.label_2.setText(_translate("Form", "x direction:"))
+        self.label_3.setText(_translate("Form", "y direction:"))